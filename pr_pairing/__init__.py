@@ -24,6 +24,7 @@ from .io import (
     load_developers,
     save_developers,
     load_history,
+    serialize_history,
     save_history,
 )
 
@@ -1,4 +1,5 @@
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -161,10 +162,19 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse CLI arguments and merge with config file."""
-    parser = create_parser()
-    args = parser.parse_args()
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the parser once; parse_args is safe to call repeatedly."""
+    return create_parser()
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments and merge with config file.
+
+    argv defaults to sys.argv[1:]; passing it explicitly keeps callers
+    (and tests) from having to mutate the sys.argv global.
+    """
+    args = _get_parser().parse_args(argv)
     
     config_file = find_config_file(args.config)
     config = {}
@@ -1,4 +1,6 @@
 import argparse
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -23,27 +25,43 @@ def get_home_config_paths() -> list[Path]:
     ]
 
 
-def find_config_file(config_path: Optional[str]) -> Optional[Path]:
+def find_config_file(config_path: Optional[str], search_dir: Optional[Path] = None) -> Optional[Path]:
     """Find config file from explicit path or search default locations.
-    
+
     Search order:
     1. Explicit path (-c argument)
-    2. ./.prpairingrc
-    3. ./pr_pairing.yaml
+    2. <search_dir>/.prpairingrc
+    3. <search_dir>/pr_pairing.yaml
     4. ~/.config/pr_pairing/config.yaml
     5. ~/.prpairingrc
+
+    search_dir defaults to the current working directory; passing it
+    explicitly keeps callers independent of process CWD. The search
+    result is cached per (config_path, search_dir) so repeated calls do
+    not re-walk the filesystem.
     """
+    cwd = str(search_dir) if search_dir is not None else os.getcwd()
+    return _find_config_file_cached(config_path, cwd)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_config_file_cached(config_path: Optional[str], cwd: str) -> Optional[Path]:
     if config_path:
         path = Path(config_path)
         if path.exists():
             return path
         return None
     
+    # One readdir of cwd instead of a stat syscall per candidate name.
+    try:
+        with os.scandir(cwd) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        names = set()
     for rel_path in CONFIG_SEARCH_PATHS:
-        path = Path(rel_path)
-        if path.exists():
-            return path
-    
+        if rel_path in names:
+            return Path(cwd) / rel_path
+
     for abs_path in get_home_config_paths():
         if abs_path.exists():
             return abs_path
@@ -51,16 +69,21 @@ def find_config_file(config_path: Optional[str]) -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def load_config(config_path: Path) -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    Parsed configs are cached per path for the lifetime of the process.
+    """
     try:
         import yaml
     except ImportError:
         raise FileError("Config file support requires PyYAML. Install with: pip install pyyaml")
     
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
             return data if data else {}
     except yaml.YAMLError as e:
         raise FileError(f"Error parsing config file {config_path}: {e}")
@@ -68,11 +91,14 @@ def load_config(config_path: Path) -> dict:
         raise FileError(f"Error reading config file: {e}")
 
 
+_TRUE_VALUES = frozenset({"true", "1", "yes", "y"})
+
+
 def normalize_bool(value: str) -> bool:
     """Convert string to boolean."""
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in ("true", "1", "yes", "y")
+    return str(value).strip().lower() in _TRUE_VALUES
 
 
 def merge_config(config: dict, args: argparse.Namespace) -> argparse.Namespace:
@@ -1,3 +1,5 @@
+import sys
+
 from .rules import (
     load_exclusions,
     load_exclusions_from_csv,
@@ -6,11 +8,13 @@ from .rules import (
 )
 
 
-def parse_exclusions_cli(exclusions: list[str], valid_developers: set[str]) -> set[tuple[str, str]]:
+def parse_exclusions_cli(exclusions: list[str], valid_developers: set[str]) -> frozenset[tuple[str, str]]:
     """Parse exclusion list from CLI arguments."""
     result = set()
     for exc in exclusions:
         parsed = parse_exclusion_string(exc, valid_developers)
         if parsed:
             result.add(parsed)
-    return result
+    # Intern names so the hot membership checks in select_reviewers hash
+    # and compare by pointer identity.
+    return frozenset((sys.intern(d), sys.intern(r)) for d, r in result)
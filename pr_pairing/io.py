@@ -2,7 +2,7 @@ import csv
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from .models import History, FileError, Developer, DEFAULT_KNOWLEDGE_LEVEL, CSVValidationError
 from .config import normalize_bool
@@ -70,18 +70,55 @@ def row_to_developer(row: dict) -> Developer:
 
 
 def load_developers(filepath: str) -> list[Developer]:
-    """Load developers from CSV file."""
-    rows = load_csv(filepath)
-    if not rows:
+    """Load developers from CSV file.
+
+    Uses csv.reader with a column-index map instead of DictReader to avoid
+    allocating a dict per row.
+    """
+    try:
+        with open(filepath, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            rows = list(reader)
+    except FileNotFoundError:
+        raise FileError(f"Input file not found: {filepath}")
+    except Exception as e:
+        raise FileError(f"Error reading input file: {e}")
+
+    if header is None or not rows:
         raise CSVValidationError("Input CSV is empty")
-    
+
+    idx = {name: i for i, name in enumerate(header)}
+
     # Validate required columns
-    if "name" not in rows[0]:
+    if "name" not in idx:
         raise CSVValidationError("CSV must have a 'name' column")
-    if "can_review" not in rows[0]:
+    if "can_review" not in idx:
         raise CSVValidationError("CSV must have a 'can_review' column")
-    
-    return [row_to_developer(row) for row in rows]
+
+    name_i = idx["name"]
+    can_review_i = idx["can_review"]
+    team_i = idx.get("team")
+    knowledge_i = idx.get("knowledge_level")
+    reviewers_i = idx.get("reviewers")
+    standard_keys = {"name", "can_review", "team", "knowledge_level", "reviewers"}
+    metadata_cols = [(col, i) for col, i in idx.items() if col not in standard_keys]
+
+    def cell(row: list[str], i: Optional[int]) -> str:
+        return row[i] if i is not None and i < len(row) else ""
+
+    developers = []
+    for row in rows:
+        reviewers_str = cell(row, reviewers_i)
+        developers.append(Developer(
+            name=cell(row, name_i),
+            can_review=normalize_bool(cell(row, can_review_i)),
+            team=cell(row, team_i).strip(),
+            knowledge_level=parse_knowledge_level(cell(row, knowledge_i)),
+            reviewers=[r.strip() for r in reviewers_str.split(",") if r.strip()],
+            metadata={col: cell(row, i) for col, i in metadata_cols},
+        ))
+    return developers
 
 
 def save_developers(filepath: str, developers: list[Developer]) -> None:
@@ -92,7 +129,16 @@ def save_developers(filepath: str, developers: list[Developer]) -> None:
     dicts = [d.to_dict() for d in developers]
     # Use keys from first dict as fieldnames to ensure all columns are included
     fieldnames = list(dicts[0].keys())
-    save_csv(filepath, dicts, fieldnames)
+    # Precompute list rows and hand them to csv.writer in one writerows call
+    # instead of per-row dict lookups in DictWriter.
+    rows = [[d.get(name, "") for name in fieldnames] for d in dicts]
+    try:
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+    except Exception as e:
+        raise FileError(f"Error writing output file: {e}")
 
 
 def load_history(filepath: str) -> History:
@@ -109,11 +155,19 @@ def load_history(filepath: str) -> History:
         return History()
 
 
+def serialize_history(history: History) -> dict:
+    """Stamp the history with the current run time and return its dict form."""
+    history.last_run = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return history.to_dict()
+
+
 def save_history(filepath: str, history: History) -> None:
     """Save pairing history to JSON file."""
-    history.last_run = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Serialize to a string first so the file sees a single write call
+    # instead of one per scalar from json.dump.
+    data = json.dumps(serialize_history(history), separators=(",", ":"))
     try:
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(history.to_dict(), f, indent=2)
+            f.write(data)
     except Exception as e:
         raise FileError(f"Error writing history file: {e}")
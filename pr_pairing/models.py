@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, TypedDict
@@ -16,7 +17,7 @@ class KnowledgeMode(Enum):
     SIMILAR_LEVELS = "similar-levels"
 
 
-@dataclass
+@dataclass(slots=True)
 class Developer:
     name: str
     can_review: bool
@@ -24,15 +25,29 @@ class Developer:
     knowledge_level: int = DEFAULT_KNOWLEDGE_LEVEL
     reviewers: list[str] = field(default_factory=list)
     metadata: dict[str, str] = field(default_factory=dict)
-    
+
+    def __post_init__(self):
+        # Interned names make the (dev, reviewer) hash/equality checks in
+        # the pairing hot path pointer comparisons.
+        self.name = sys.intern(self.name)
+
     def to_dict(self) -> dict:
-        """Convert to dictionary for CSV/JSON output, including metadata."""
-        data = asdict(self)
-        # Flatten metadata back into the main dict
-        meta = data.pop("metadata", {})
-        data.update(meta)
-        # Convert reviewers list to comma-separated string for CSV
-        data["reviewers"] = ", ".join(self.reviewers)
+        """Convert to dictionary for CSV/JSON output, including metadata.
+
+        Builds the dict directly instead of going through asdict(), which
+        recursively deep-copies every field. Reviewers are mutated after
+        construction, so the result is never cached.
+        """
+        data = {
+            "name": self.name,
+            "can_review": self.can_review,
+            "team": self.team,
+            "knowledge_level": self.knowledge_level,
+            # Convert reviewers list to comma-separated string for CSV
+            "reviewers": ", ".join(self.reviewers),
+        }
+        # Flatten metadata into the main dict
+        data.update(self.metadata)
         return data
 
 
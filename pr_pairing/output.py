@@ -1,3 +1,4 @@
+import functools
 import json
 from datetime import datetime, timezone
 from typing import Any
@@ -59,14 +60,17 @@ def format_output_yaml(
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=64)
 def get_output_format(output_path: str | None, output_format_arg: str | None) -> str:
     """Determine output format based on file extension and explicit format argument.
-    
+
     Priority:
     1. If output_format_arg is explicitly provided, use it
     2. If output_path ends with .json, use json
     3. If output_path ends with .yaml or .yml, use yaml
     4. Default to csv
+
+    Pure function of its string arguments, so results are memoized.
     """
     if output_format_arg:
         return output_format_arg
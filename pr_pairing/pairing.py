@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Optional
+from typing import Iterable, Optional
 
 from .models import (
     KnowledgeMode,
@@ -11,6 +11,17 @@ from .models import (
 )
 
 
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+
+
+def _index_exclusions(exclusions: Iterable[tuple[str, str]]) -> dict[str, frozenset[str]]:
+    """Index exclusion pairs by developer for O(1) per-candidate lookups."""
+    by_dev: dict[str, set[str]] = {}
+    for dev, reviewer in exclusions:
+        by_dev.setdefault(dev, set()).add(reviewer)
+    return {dev: frozenset(reviewers) for dev, reviewers in by_dev.items()}
+
+
 def is_same_team(candidate: Developer, dev_team: Optional[str]) -> bool:
     """Check if candidate is on the same team as the developer."""
     return bool(dev_team and candidate.team == dev_team)
@@ -304,25 +315,32 @@ def select_reviewers(
     exclusions: Optional[set[tuple[str, str]]] = None,
     requirements: Optional[dict[str, list[str]]] = None,
     balance_mode: bool = True,
+    exclusion_index: Optional[dict[str, frozenset[str]]] = None,
 ) -> tuple[list[str], list[str]]:
     """
     Select reviewers for a developer.
     Returns (selected_reviewer_names, warnings).
+
+    Callers that invoke this per developer can pass exclusion_index
+    (from _index_exclusions) to avoid re-scanning the pair set.
     """
     warnings = []
-    
+
     if requirements is None:
         requirements = {}
-    
+
     if exclusions is None:
         exclusions = set()
-    
+
     candidates = [c for c in candidates if c.name != dev.name]
-    
+
     if not candidates:
         return [], [f"No reviewers available for {dev.name}"]
-    
-    excluded_reviewers = {reviewer for d, reviewer in exclusions if d == dev.name}
+
+    if exclusion_index is not None:
+        excluded_reviewers = exclusion_index.get(dev.name, _EMPTY_FROZENSET)
+    else:
+        excluded_reviewers = {r for d, r in exclusions if d == dev.name}
     if excluded_reviewers:
         candidates = [c for c in candidates if c.name not in excluded_reviewers]
         
@@ -406,19 +424,22 @@ def assign_reviewers_bucket(
     required_assignments = req_assignments
     required_reviewers_used = req_reviewers_used
     
+    excl_idx = _index_exclusions(exclusions)
+
     all_pairs = []
     for dev in developers:
         dev_requirements = required_assignments.get(dev.name, [])
-        
+        dev_exclusions = excl_idx.get(dev.name, _EMPTY_FROZENSET)
+
         for reviewer in reviewers:
             if dev.name == reviewer.name:
                 continue
-            
+
             if dev.name in required_assignments:
                 if reviewer.name in required_assignments[dev.name]:
                     continue
-            
-            if (dev.name, reviewer.name) in exclusions:
+
+            if reviewer.name in dev_exclusions:
                 continue
             
             if not is_valid_knowledge_pair(dev, reviewer, knowledge_mode):
@@ -538,7 +559,9 @@ def assign_reviewers(
     
     for reviewer_name in required_reviewers_used:
         current_assignments[reviewer_name] += 1
-    
+
+    excl_idx = _index_exclusions(exclusions)
+
     for developer in developers:
         if not reviewers:
             developer.reviewers = []
@@ -557,7 +580,8 @@ def assign_reviewers(
             knowledge_mode=knowledge_mode,
             exclusions=exclusions,
             requirements=requirements,
-            balance_mode=balance_mode
+            balance_mode=balance_mode,
+            exclusion_index=excl_idx
         )
         
         all_warnings.extend(warnings)
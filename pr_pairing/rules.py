@@ -1,71 +1,92 @@
 from pathlib import Path
+from typing import TextIO
 import csv
+import sys
 
 from .models import FileError
 
 YAML_AVAILABLE = True
 try:
     import yaml
+    # libyaml's C parser when PyYAML was built with it; same safe-load
+    # semantics, several times faster than the pure-Python loader.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 
 
+RuleSource = str | TextIO
+
+
+def _csv_rows(source: RuleSource):
+    """Yield CSV rows from a path or an already-open text stream."""
+    if hasattr(source, "read"):
+        yield from csv.DictReader(source)
+    else:
+        with open(source, "r", newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+
+
+def _yaml_data(source: RuleSource):
+    """Parse YAML from a path or an already-open text stream."""
+    if hasattr(source, "read"):
+        return yaml.load(source, Loader=_YAML_LOADER)
+    with open(source, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_csv_rules_as_dict(
-    filepath: str,
+    source: RuleSource,
     key_column: str,
     value_column: str,
 ) -> dict[str, list[str]]:
-    """Load rules from CSV file as dict."""
+    """Load rules from CSV file or stream as dict."""
 
     result: dict[str, list[str]] = {}
 
     try:
-        with open(filepath, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                key = row.get(key_column, "").strip()
-                value = row.get(value_column, "").strip()
-                if key and value:
-                    if key not in result:
-                        result[key] = []
-                    result[key].append(value)
+        for row in _csv_rows(source):
+            key = row.get(key_column, "").strip()
+            value = row.get(value_column, "").strip()
+            if key and value:
+                if key not in result:
+                    result[key] = []
+                result[key].append(value)
     except FileNotFoundError:
-        raise FileError(f"Rules file not found: {filepath}")
+        raise FileError(f"Rules file not found: {source}")
     except Exception as e:
         raise FileError(f"Error reading rules file: {e}")
     return result
 
 
 def load_csv_rules_as_set(
-    filepath: str,
+    source: RuleSource,
     key_column: str,
     value_column: str,
 ) -> set[tuple[str, str]]:
-    """Load rules from CSV file as set."""
+    """Load rules from CSV file or stream as set."""
     result: set[tuple[str, str]] = set()
 
     try:
-        with open(filepath, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                key = row.get(key_column, "").strip()
-                value = row.get(value_column, "").strip()
-                if key and value:
-                    result.add((key, value))
+        for row in _csv_rows(source):
+            key = row.get(key_column, "").strip()
+            value = row.get(value_column, "").strip()
+            if key and value:
+                result.add((key, value))
     except FileNotFoundError:
-        raise FileError(f"Rules file not found: {filepath}")
+        raise FileError(f"Rules file not found: {source}")
     except Exception as e:
         raise FileError(f"Error reading rules file: {e}")
     return result
 
 
 def load_yaml_rules_as_dict(
-    filepath: str,
+    source: RuleSource,
     key_field: str,
     value_field: str,
     root_key: str = "rules",
 ) -> dict[str, list[str]]:
-    """Load rules from YAML file as dict."""
+    """Load rules from YAML file or stream as dict."""
     if not YAML_AVAILABLE:
         raise FileError(
             "YAML support requires PyYAML. Install with: pip install pyyaml"
@@ -74,8 +95,7 @@ def load_yaml_rules_as_dict(
     result: dict[str, list[str]] = {}
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _yaml_data(source)
 
         if not data:
             return result
@@ -88,18 +108,18 @@ def load_yaml_rules_as_dict(
             if key and values:
                 result[key] = values
     except FileNotFoundError:
-        raise FileError(f"Rules file not found: {filepath}")
+        raise FileError(f"Rules file not found: {source}")
     except Exception as e:
         raise FileError(f"Error reading rules file: {e}")
     return result
 
 
 def load_yaml_rules_as_set(
-    filepath: str,
+    source: RuleSource,
     key_field: str,
     value_field: str,
 ) -> set[tuple[str, str]]:
-    """Load rules from YAML file as set."""
+    """Load rules from YAML file or stream as set."""
     if not YAML_AVAILABLE:
         raise FileError(
             "YAML support requires PyYAML. Install with: pip install pyyaml"
@@ -108,8 +128,7 @@ def load_yaml_rules_as_set(
     result: set[tuple[str, str]] = set()
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _yaml_data(source)
 
         if not data:
             return result
@@ -126,7 +145,7 @@ def load_yaml_rules_as_set(
                 else:
                     result.add((key, values))
     except FileNotFoundError:
-        raise FileError(f"Rules file not found: {filepath}")
+        raise FileError(f"Rules file not found: {source}")
     except Exception as e:
         raise FileError(f"Error reading rules file: {e}")
     return result
@@ -208,13 +227,20 @@ def _validate_set_rules(
     return rules
 
 
-def load_exclusions_from_csv(filepath: str) -> set[tuple[str, str]]:
-    """Load exclusion pairs from CSV file."""
-    return load_csv_rules_as_set(filepath, "developer", "excluded_reviewer")
+def _freeze_exclusions(pairs: set[tuple[str, str]]) -> frozenset[tuple[str, str]]:
+    """Intern names and freeze the pair set for cheap membership checks."""
+    return frozenset((sys.intern(d), sys.intern(r)) for d, r in pairs)
+
+
+def load_exclusions_from_csv(source: RuleSource) -> frozenset[tuple[str, str]]:
+    """Load exclusion pairs from CSV file or stream."""
+    return _freeze_exclusions(
+        load_csv_rules_as_set(source, "developer", "excluded_reviewer")
+    )
 
 
-def load_exclusions_from_yaml(filepath: str) -> set[tuple[str, str]]:
-    """Load exclusion pairs from YAML file."""
+def load_exclusions_from_yaml(source: RuleSource) -> frozenset[tuple[str, str]]:
+    """Load exclusion pairs from YAML file or stream."""
     if not YAML_AVAILABLE:
         raise FileError(
             "YAML support requires PyYAML. Install with: pip install pyyaml"
@@ -223,11 +249,10 @@ def load_exclusions_from_yaml(filepath: str) -> set[tuple[str, str]]:
     exclusions: set[tuple[str, str]] = set()
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _yaml_data(source)
 
         if not data:
-            return exclusions
+            return frozenset()
 
         exclusions_list = data.get("exclusions", [])
         for item in exclusions_list:
@@ -236,13 +261,13 @@ def load_exclusions_from_yaml(filepath: str) -> set[tuple[str, str]]:
                 exclusions.add((developers[0], developers[1]))
                 exclusions.add((developers[1], developers[0]))
     except FileNotFoundError:
-        raise FileError(f"Exclusion file not found: {filepath}")
+        raise FileError(f"Exclusion file not found: {source}")
     except Exception as e:
         raise FileError(f"Error reading exclusion file: {e}")
-    return exclusions
+    return _freeze_exclusions(exclusions)
 
 
-def load_exclusions(filepath: str, valid_developers: set[str]) -> set[tuple[str, str]]:
+def load_exclusions(filepath: str, valid_developers: set[str]) -> frozenset[tuple[str, str]]:
     """Load exclusion pairs from file (auto-detect format by extension)."""
     path = Path(filepath)
     suffix = path.suffix.lower()
@@ -1,15 +1,14 @@
-import csv
+import argparse
+import copy
 import json
-import os
-import tempfile
-from pathlib import Path
 
 import pytest
 
-from pr_pairing import History
+from pr_pairing import Developer, History
+from pr_pairing.cli import parse_arguments
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_csv_content():
     return """name,can_review
 Alice,true
@@ -18,7 +17,7 @@ Charlie,true
 Dana,true"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csv_with_teams_content():
     return """name,can_review,team
 Alice,true,frontend
@@ -27,7 +26,7 @@ Charlie,true,backend
 Dana,true,backend"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csv_with_knowledge_content():
     return """name,can_review,knowledge_level
 Alice,true,5
@@ -36,7 +35,7 @@ Charlie,true,3
 Dana,true,4"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csv_full_content():
     return """name,can_review,team,knowledge_level
 Alice,true,frontend,5
@@ -47,13 +46,51 @@ Eve,true,,3
 Frank,false,frontend,5"""
 
 
-@pytest.fixture
-def empty_history():
+@pytest.fixture(scope="session")
+def _empty_history_proto():
     return History(pairs={}, last_run=None)
 
 
 @pytest.fixture
-def sample_history():
+def empty_history(_empty_history_proto):
+    return copy.deepcopy(_empty_history_proto)
+
+
+@pytest.fixture
+def abc_devs():
+    """Three plain reviewers; function-scoped because assign_reviewers mutates them."""
+    return [Developer(name=n, can_review=True) for n in ("Alice", "Bob", "Charlie")]
+
+
+@pytest.fixture(scope="module")
+def three_mixed_candidates():
+    return [
+        Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
+        Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
+        Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
+    ]
+
+
+@pytest.fixture(scope="module")
+def three_knowledge_candidates():
+    return [
+        Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
+        Developer(name="Bob", can_review=True, team="backend", knowledge_level=2),
+        Developer(name="Charlie", can_review=True, team="backend", knowledge_level=4),
+    ]
+
+
+@pytest.fixture(scope="module")
+def three_team_candidates():
+    return [
+        Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
+        Developer(name="Bob", can_review=True, team="frontend", knowledge_level=3),
+        Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
+    ]
+
+
+@pytest.fixture(scope="session")
+def _sample_history_proto():
     return History(
         pairs={
             "Alice": {"Bob": 2, "Charlie": 1},
@@ -64,66 +101,121 @@ def sample_history():
 
 
 @pytest.fixture
-def temp_csv(request, basic_csv_content):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(basic_csv_content)
-        temp_path = f.name
+def sample_history(_sample_history_proto):
+    return copy.deepcopy(_sample_history_proto)
 
-    yield temp_path
 
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+@pytest.fixture(scope="session")
+def _base_args_proto(alice_true_csv):
+    """Parse the no-flag CLI invocation once per session."""
+    return parse_arguments(["-i", alice_true_csv])
 
 
 @pytest.fixture
-def temp_csv_teams(request, csv_with_teams_content):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(csv_with_teams_content)
-        temp_path = f.name
+def base_args(_base_args_proto):
+    return argparse.Namespace(**vars(_base_args_proto))
 
-    yield temp_path
 
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+@pytest.fixture(scope="session")
+def basic_csv(tmp_path_factory, basic_csv_content):
+    """Read-only path for basic_csv_content; use temp_csv if the test writes."""
+    path = tmp_path_factory.mktemp("csv") / "basic.csv"
+    path.write_text(basic_csv_content)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def csv_two_devs(tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "two.csv"
+    path.write_text("name,can_review,team,knowledge_level\nAlice,true,frontend,5\nBob,true,backend,3")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def csv_bool_variants(tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "bools.csv"
+    path.write_text("name,can_review\nAlice,True\nBob,false\nCharlie,yes")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def csv_kl_variants(tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "levels.csv"
+    path.write_text("name,can_review,knowledge_level\nAlice,3\nBob,invalid\nCharlie,")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def alice_true_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp("csv") / "alice.csv"
+    path.write_text("name,can_review\nAlice,true")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def requirements_csv(tmp_path_factory):
+    path = tmp_path_factory.mktemp("req") / "requirements.csv"
+    path.write_text(
+        "developer,required_reviewer\n"
+        "Bob,Alice\n"
+        "Bob,Charlie\n"
+        "Dana,Alice\n"
+    )
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def requirements_yaml(tmp_path_factory):
+    path = tmp_path_factory.mktemp("req") / "requirements.yaml"
+    path.write_text(
+        "requirements:\n"
+        "  - developer: Bob\n"
+        "    required_reviewers:\n"
+        "      - Alice\n"
+        "      - Charlie\n"
+        "  - developer: Dana\n"
+        "    required_reviewers:\n"
+        "      - Alice\n"
+    )
+    return str(path)
 
 
 @pytest.fixture
-def temp_csv_full(request, csv_full_content):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(csv_full_content)
-        temp_path = f.name
+def temp_csv(tmp_path, basic_csv_content):
+    path = tmp_path / "team.csv"
+    path.write_text(basic_csv_content)
+    return str(path)
 
-    yield temp_path
 
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+@pytest.fixture
+def temp_csv_teams(tmp_path, csv_with_teams_content):
+    path = tmp_path / "teams.csv"
+    path.write_text(csv_with_teams_content)
+    return str(path)
 
 
 @pytest.fixture
-def temp_history(request, empty_history):
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(empty_history.to_dict(), f)
-        temp_path = f.name
+def temp_csv_full(tmp_path, csv_full_content):
+    path = tmp_path / "full.csv"
+    path.write_text(csv_full_content)
+    return str(path)
 
-    yield temp_path
 
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+@pytest.fixture
+def temp_history(tmp_path, empty_history):
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps(empty_history.to_dict()))
+    return str(path)
 
 
 @pytest.fixture
-def temp_csv_with_reviewers(request, basic_csv_content):
+def temp_csv_with_reviewers(tmp_path):
     content = """name,can_review,reviewers
 Alice,true,Bob, Charlie
 Bob,true,Alice
 Charlie,true,Dana
 Dana,true,"""
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(content)
-        temp_path = f.name
-
-    yield temp_path
-
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    path = tmp_path / "reviewers.csv"
+    path.write_text(content)
+    return str(path)
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CLI_SCRIPT = REPO_ROOT / "pr_pairing.py"
+
+
+@pytest.fixture
+def run_cli(tmp_path):
+    """Run the CLI in an isolated per-test working directory.
+
+    The subprocess runs with cwd=tmp_path, so the default
+    ./pairing_history.json (and any other relative path) lands in the
+    test's own temp dir instead of the repo root. That keeps
+    pytest-xdist workers from racing on a shared history file and
+    keeps generated artifacts out of the checkout.
+    """
+    def _run(*args):
+        return subprocess.run(
+            [sys.executable, str(CLI_SCRIPT), *map(str, args)],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+    return _run
@@ -1,51 +1,33 @@
 import json
 import os
-import subprocess
-import tempfile
+from pathlib import Path
 
 
 class TestDryRunMode:
     """Test dry-run mode functionality."""
     
-    def test_dry_run_does_not_modify_csv(self, temp_csv):
-        with open(temp_csv, 'r') as f:
-            original_content = f.read()
+    def test_dry_run_does_not_modify_csv(self, temp_csv, run_cli):
+        original_content = Path(temp_csv).read_text()
         
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+        result = run_cli("-i", temp_csv, "-r", "2", "--dry-run")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
         
-        with open(temp_csv, 'r') as f:
-            final_content = f.read()
+        final_content = Path(temp_csv).read_text()
         
         assert original_content == final_content
     
-    def test_dry_run_does_not_modify_history(self, temp_csv):
+    def test_dry_run_does_not_modify_history(self, temp_csv, run_cli):
         history_path = temp_csv.replace('.csv', '_history.json')
         
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+        result = run_cli("-i", temp_csv, "-r", "2", "--dry-run")
         
         assert result.returncode == 0
         assert not os.path.exists(history_path)
     
-    def test_dry_run_output_format(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_dry_run_output_format(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "--dry-run")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
@@ -53,132 +35,69 @@ class TestDryRunMode:
         assert "Assignments:" in result.stdout
         assert "Total:" in result.stdout
     
-    def test_dry_run_shows_warnings(self, temp_csv_teams):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv_teams, "-r", "2", "-t", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_dry_run_shows_warnings(self, temp_csv_teams, run_cli):
+        result = run_cli("-i", temp_csv_teams, "-r", "2", "-t", "--dry-run")
         
         assert result.returncode == 0
         assert "Warnings" in result.stdout or "would appear" in result.stdout
     
-    def test_dry_run_short_flag(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "-n"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_dry_run_short_flag(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "-n")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
     
-    def test_dry_run_with_knowledge_mode(self, temp_csv_full):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv_full, "-r", "2", "-k", "experts-only", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_dry_run_with_knowledge_mode(self, temp_csv_full, run_cli):
+        result = run_cli("-i", temp_csv_full, "-r", "2", "-k", "experts-only", "--dry-run")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
     
-    def test_dry_run_no_history_loaded(self, temp_csv):
-        history_path = "./pairing_history.json"
-        
-        if os.path.exists(history_path):
-            os.unlink(history_path)
-        
-        result1 = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
-        
-        with open(history_path, 'r') as f:
-            history_after_normal = json.load(f)
-        
-        result2 = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
-        
-        with open(history_path, 'r') as f:
-            history_after_dry_run = json.load(f)
-        
+    def test_dry_run_no_history_loaded(self, temp_csv, tmp_path, run_cli):
+        # run_cli runs with cwd=tmp_path, so the default history path
+        # resolves to a file private to this test.
+        history_path = tmp_path / "pairing_history.json"
+
+        result1 = run_cli("-i", temp_csv, "-r", "2")
+
+        history_after_normal = json.loads(history_path.read_text())
+
+        result2 = run_cli("-i", temp_csv, "-r", "2", "--dry-run")
+
+        history_after_dry_run = json.loads(history_path.read_text())
+
         assert history_after_normal == history_after_dry_run
-        
-        os.unlink(history_path)
 
 
 class TestFreshMode:
     """Test fresh mode functionality."""
     
-    def test_fresh_ignores_existing_history(self, temp_csv):
-        history_path = "./pairing_history.json"
-        
-        if os.path.exists(history_path):
-            os.unlink(history_path)
-        
-        subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
-        
-        with open(history_path, 'r') as f:
-            history1 = json.load(f)
-        
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--fresh"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
-        
-        with open(history_path, 'r') as f:
-            history2 = json.load(f)
-        
+    def test_fresh_ignores_existing_history(self, temp_csv, tmp_path, run_cli):
+        history_path = tmp_path / "pairing_history.json"
+
+        run_cli("-i", temp_csv, "-r", "2")
+
+        history1 = json.loads(history_path.read_text())
+
+        result = run_cli("-i", temp_csv, "-r", "2", "--fresh")
+
+        history2 = json.loads(history_path.read_text())
+
         assert history1 != history2
-        
-        if os.path.exists(history_path):
-            os.unlink(history_path)
     
-    def test_fresh_short_flag(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "-f"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_fresh_short_flag(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "-f")
         
         assert result.returncode == 0
         assert "Successfully assigned" in result.stdout
     
-    def test_fresh_with_team_mode(self, temp_csv_teams):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv_teams, "-r", "2", "-t", "--fresh"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_fresh_with_team_mode(self, temp_csv_teams, run_cli):
+        result = run_cli("-i", temp_csv_teams, "-r", "2", "-t", "--fresh")
         
         assert result.returncode == 0
     
-    def test_fresh_with_dry_run(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--fresh", "--dry-run"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_fresh_with_dry_run(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "--fresh", "--dry-run")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
@@ -187,118 +106,68 @@ class TestFreshMode:
 class TestVerboseQuiet:
     """Test verbose and quiet output modes."""
 
-    def test_default_verbosity_shows_success(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_default_verbosity_shows_success(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2")
         
         assert result.returncode == 0
         assert "Successfully assigned" in result.stdout
 
-    def test_verbose_flag_shows_info(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "-v"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_verbose_flag_shows_info(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "-v")
         
         assert result.returncode == 0
         assert "Successfully assigned" in result.stdout
         assert "Output written to:" in result.stderr
 
-    def test_verbose_flag_short(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--verbose"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_verbose_flag_short(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "--verbose")
         
         assert result.returncode == 0
         assert "Output written to:" in result.stderr
 
-    def test_quiet_flag_suppresses_output(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "-q"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_quiet_flag_suppresses_output(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "-q")
         
         assert result.returncode == 0
         assert result.stdout == ""
         assert result.stderr == ""
 
-    def test_quiet_flag_short(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--quiet"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_quiet_flag_short(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "--quiet")
         
         assert result.returncode == 0
         assert result.stdout == ""
         assert result.stderr == ""
 
-    def test_silent_flag_suppresses_all(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "-qq"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_silent_flag_suppresses_all(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "-qq")
         
         assert result.returncode == 0
         assert result.stdout == ""
         assert result.stderr == ""
 
-    def test_quiet_still_shows_errors(self):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", "nonexistent.csv", "-r", "2", "-q"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_quiet_still_shows_errors(self, run_cli):
+        result = run_cli("-i", "nonexistent.csv", "-r", "2", "-q")
         
         assert result.returncode == 1
         assert "Error:" in result.stderr
 
-    def test_verbose_with_dry_run(self, temp_csv):
-        result = subprocess.run(
-            ["python", "pr_pairing.py", "-i", temp_csv, "-r", "2", "--dry-run", "-v"],
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-            capture_output=True,
-            text=True
-        )
+    def test_verbose_with_dry_run(self, temp_csv, run_cli):
+        result = run_cli("-i", temp_csv, "-r", "2", "--dry-run", "-v")
         
         assert result.returncode == 0
         assert "[DRY RUN]" in result.stdout
 
-    def test_quiet_with_warnings(self, temp_csv):
+    def test_quiet_with_warnings(self, tmp_path, run_cli):
         content = """name,can_review
 Alice,true
 Bob,false
 Charlie,true"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(content)
-            temp_path = f.name
 
-        try:
-            result = subprocess.run(
-                ["python", "pr_pairing.py", "-i", temp_path, "-r", "2", "-q"],
-                cwd=os.path.dirname(os.path.abspath(__file__)) + "/../..",
-                capture_output=True,
-                text=True
-            )
-            
-            assert result.returncode == 0
-            assert result.stdout == ""
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        temp_path = tmp_path / "team.csv"
+        temp_path.write_text(content)
+
+        result = run_cli("-i", temp_path, "-r", "2", "-q")
+
+        assert result.returncode == 0
+        assert result.stdout == ""
@@ -1,110 +1,92 @@
+import itertools
+from collections import Counter
+
 import pytest
 
-from pr_pairing import assign_reviewers, KnowledgeMode, Developer, History
+from pr_pairing import assign_reviewers, KnowledgeMode, Developer
 
 
-class TestAssignReviewers:
-    def test_assign_reviewers_basic(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
-        
-        warnings = assign_reviewers(
-            developers=developers,
-            history=history,
-            num_reviewers=1,
-            team_mode=False,
-            knowledge_mode=KnowledgeMode.ANYONE
-        )
-        
-        assert len(developers) == 2
-        assert developers[0].reviewers or developers[1].reviewers
+def _review_counts(developers):
+    return Counter(itertools.chain.from_iterable(d.reviewers for d in developers))
 
-    def test_assign_reviewers_respects_can_review_false(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=False),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
-        
-        warnings = assign_reviewers(
-            developers=developers,
-            history=history,
-            num_reviewers=1,
-            team_mode=False,
-            knowledge_mode=KnowledgeMode.ANYONE
-        )
-        
-        alice = next(d for d in developers if d.name == "Alice")
-        assert "Bob" not in alice.reviewers
 
-    def test_assign_reviewers_with_team_mode(self):
-        developers = [
-            Developer(name="Alice", can_review=True, team="frontend"),
-            Developer(name="Bob", can_review=True, team="frontend"),
-            Developer(name="Charlie", can_review=True, team="backend"),
-        ]
-        history = History(pairs={}, last_run=None)
-        
-        warnings = assign_reviewers(
-            developers=developers,
-            history=history,
-            num_reviewers=1,
-            team_mode=True,
-            knowledge_mode=KnowledgeMode.ANYONE
-        )
-        
-        alice = next(d for d in developers if d.name == "Alice")
-        assert "Bob" in alice.reviewers or "Charlie" in alice.reviewers
+def by_name(developers):
+    return {d.name: d for d in developers}
 
-    def test_assign_reviewers_with_knowledge_mode(self):
-        developers = [
-            Developer(name="Alice", can_review=True, knowledge_level=5),
-            Developer(name="Bob", can_review=True, knowledge_level=1),
-            Developer(name="Charlie", can_review=True, knowledge_level=3),
-        ]
-        history = History(pairs={}, last_run=None)
-        
-        warnings = assign_reviewers(
-            developers=developers,
-            history=history,
-            num_reviewers=1,
-            team_mode=False,
-            knowledge_mode=KnowledgeMode.EXPERTS_ONLY
-        )
-        
-        bob = next(d for d in developers if d.name == "Bob")
-        assert "Alice" in bob.reviewers
 
-    def test_assign_reviewers_partial_assignment_warning(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
-        
+class TestAssignReviewers:
+    @pytest.mark.parametrize("devs_factory,kwargs,check", [
+        (
+            lambda: [
+                Developer(name="Alice", can_review=True),
+                Developer(name="Bob", can_review=True),
+            ],
+            dict(num_reviewers=1, team_mode=False, knowledge_mode=KnowledgeMode.ANYONE),
+            lambda devs, warnings: devs[0].reviewers or devs[1].reviewers,
+        ),
+        (
+            lambda: [
+                Developer(name="Alice", can_review=True),
+                Developer(name="Bob", can_review=False),
+                Developer(name="Charlie", can_review=True),
+            ],
+            dict(num_reviewers=1, team_mode=False, knowledge_mode=KnowledgeMode.ANYONE),
+            lambda devs, warnings: "Bob" not in by_name(devs)["Alice"].reviewers,
+        ),
+        (
+            lambda: [
+                Developer(name="Alice", can_review=True, team="frontend"),
+                Developer(name="Bob", can_review=True, team="frontend"),
+                Developer(name="Charlie", can_review=True, team="backend"),
+            ],
+            dict(num_reviewers=1, team_mode=True, knowledge_mode=KnowledgeMode.ANYONE),
+            lambda devs, warnings: set(by_name(devs)["Alice"].reviewers) & {"Bob", "Charlie"},
+        ),
+        (
+            lambda: [
+                Developer(name="Alice", can_review=True, knowledge_level=5),
+                Developer(name="Bob", can_review=True, knowledge_level=1),
+                Developer(name="Charlie", can_review=True, knowledge_level=3),
+            ],
+            dict(num_reviewers=1, team_mode=False, knowledge_mode=KnowledgeMode.EXPERTS_ONLY),
+            lambda devs, warnings: "Alice" in by_name(devs)["Bob"].reviewers,
+        ),
+        (
+            lambda: [
+                Developer(name="Alice", can_review=True),
+            ],
+            dict(num_reviewers=3, team_mode=False, knowledge_mode=KnowledgeMode.ANYONE),
+            lambda devs, warnings: len(warnings) > 0,
+        ),
+    ], ids=[
+        "basic",
+        "respects_can_review_false",
+        "team_mode",
+        "knowledge_mode",
+        "partial_assignment_warning",
+    ])
+    def test_assign_reviewers(self, empty_history, devs_factory, kwargs, check):
+        developers = devs_factory()
+        history = empty_history
+
         warnings = assign_reviewers(
             developers=developers,
             history=history,
-            num_reviewers=3,
-            team_mode=False,
-            knowledge_mode=KnowledgeMode.ANYONE
+            **kwargs
         )
-        
-        assert len(warnings) > 0
+
+        assert check(developers, warnings)
 
 
 class TestBucketAssignment:
-    def test_bucket_assignments_balanced_load(self):
+    def test_bucket_assignments_balanced_load(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True),
             Developer(name="Bob", can_review=True),
             Developer(name="Charlie", can_review=True),
             Developer(name="Dana", can_review=True),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -115,23 +97,20 @@ class TestBucketAssignment:
             balance_mode=True
         )
         
-        review_counts = {}
-        for dev in developers:
-            for reviewer in dev.reviewers:
-                review_counts[reviewer] = review_counts.get(reviewer, 0) + 1
+        review_counts = _review_counts(developers)
         
         max_reviews = max(review_counts.values())
         min_reviews = min(review_counts.values())
         assert max_reviews - min_reviews <= 1
 
-    def test_bucket_team_coverage(self):
+    def test_bucket_team_coverage(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, team="frontend"),
             Developer(name="Bob", can_review=True, team="frontend"),
             Developer(name="Charlie", can_review=True, team="backend"),
             Developer(name="Dana", can_review=True, team="backend"),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -142,19 +121,18 @@ class TestBucketAssignment:
             balance_mode=True
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
-        bob = next(d for d in developers if d.name == "Bob")
-        
-        assert "Bob" in alice.reviewers
-        assert "Alice" in bob.reviewers
+        devs = by_name(developers)
+
+        assert "Bob" in devs["Alice"].reviewers
+        assert "Alice" in devs["Bob"].reviewers
 
-    def test_bucket_with_unbalanced_teams(self):
+    def test_bucket_with_unbalanced_teams(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, team="team1"),
             Developer(name="Bob", can_review=True, team="team1"),
             Developer(name="Charlie", can_review=True, team="team2"),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -165,18 +143,18 @@ class TestBucketAssignment:
             balance_mode=True
         )
         
-        charlie = next(d for d in developers if d.name == "Charlie")
+        charlie = by_name(developers)["Charlie"]
         assert len(charlie.reviewers) == 2
         
         team1_devs = [d for d in developers if d.team == "team1"]
         for dev in team1_devs:
             assert len(dev.reviewers) == 2
 
-    def test_bucket_no_reviewers_available_warning(self):
+    def test_bucket_no_reviewers_available_warning(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -190,13 +168,13 @@ class TestBucketAssignment:
         assert len(warnings) > 0
         assert "No reviewers available" in warnings[0]
 
-    def test_bucket_with_knowledge_mode(self):
+    def test_bucket_with_knowledge_mode(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, knowledge_level=5),
             Developer(name="Bob", can_review=True, knowledge_level=1),
             Developer(name="Charlie", can_review=True, knowledge_level=3),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -207,15 +185,15 @@ class TestBucketAssignment:
             balance_mode=True
         )
         
-        bob = next(d for d in developers if d.name == "Bob")
+        bob = by_name(developers)["Bob"]
         assert "Alice" in bob.reviewers
 
-    def test_bucket_updates_history(self):
+    def test_bucket_updates_history(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True),
             Developer(name="Bob", can_review=True),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         assign_reviewers(
             developers=developers,
@@ -1,57 +1,33 @@
-import tempfile
+import itertools
+from collections import Counter
 
 import pytest
 
-from pr_pairing import assign_reviewers, select_reviewers, KnowledgeMode, Developer, History
+from pr_pairing import assign_reviewers, select_reviewers, KnowledgeMode, Developer
 from pr_pairing.cli import parse_arguments, merge_config
 
 
+def _review_counts(developers):
+    return Counter(itertools.chain.from_iterable(d.reviewers for d in developers))
+
+
+def by_name(developers):
+    return {d.name: d for d in developers}
+
+
 class TestBalanceMode:
-    def test_no_balance_flag_default(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path]
-            
-            args = parse_arguments()
-            
-            assert args.no_balance is False
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_no_balance_flag_explicit(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '--no-balance']
-            
-            args = parse_arguments()
-            
-            assert args.no_balance is True
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
+    @pytest.mark.parametrize("extra_argv,expected", [
+        ([], False),
+        (["--no-balance"], True),
+    ], ids=["default", "explicit"])
+    def test_no_balance_flag(self, alice_true_csv, extra_argv, expected):
+        args = parse_arguments(["-i", alice_true_csv, *extra_argv])
 
-    def test_balance_mode_distributes_evenly(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
+        assert args.no_balance is expected
+
+    def test_balance_mode_distributes_evenly(self, abc_devs, empty_history):
+        developers = abc_devs
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -62,10 +38,7 @@ class TestBalanceMode:
             balance_mode=True
         )
         
-        review_counts = {}
-        for dev in developers:
-            for reviewer in dev.reviewers:
-                review_counts[reviewer] = review_counts.get(reviewer, 0) + 1
+        review_counts = _review_counts(developers)
         
         total_reviews = sum(review_counts.values())
         assert total_reviews == 3
@@ -74,13 +47,9 @@ class TestBalanceMode:
         min_reviews = min(review_counts.values())
         assert max_reviews - min_reviews <= 1
 
-    def test_balance_mode_with_2_reviewers_per_dev(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
+    def test_balance_mode_with_2_reviewers_per_dev(self, abc_devs, empty_history):
+        developers = abc_devs
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -91,10 +60,7 @@ class TestBalanceMode:
             balance_mode=True
         )
         
-        review_counts = {}
-        for dev in developers:
-            for reviewer in dev.reviewers:
-                review_counts[reviewer] = review_counts.get(reviewer, 0) + 1
+        review_counts = _review_counts(developers)
         
         total_reviews = sum(review_counts.values())
         assert total_reviews == 6
@@ -103,13 +69,13 @@ class TestBalanceMode:
         min_reviews = min(review_counts.values())
         assert max_reviews - min_reviews <= 1
 
-    def test_no_balance_mode_team_priority(self):
+    def test_no_balance_mode_team_priority(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, team="frontend"),
             Developer(name="Bob", can_review=True, team="frontend"),
             Developer(name="Charlie", can_review=True, team="backend"),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -120,16 +86,16 @@ class TestBalanceMode:
             balance_mode=False
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
+        alice = by_name(developers)["Alice"]
         assert "Bob" in alice.reviewers
 
-    def test_balance_mode_with_team_mode(self):
+    def test_balance_mode_with_team_mode(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, team="frontend"),
             Developer(name="Bob", can_review=True, team="frontend"),
             Developer(name="Charlie", can_review=True, team="backend"),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -140,23 +106,20 @@ class TestBalanceMode:
             balance_mode=True
         )
         
-        review_counts = {}
-        for dev in developers:
-            for reviewer in dev.reviewers:
-                review_counts[reviewer] = review_counts.get(reviewer, 0) + 1
+        review_counts = _review_counts(developers)
         
         max_reviews = max(review_counts.values())
         min_reviews = min(review_counts.values())
         assert max_reviews - min_reviews <= 1
 
-    def test_balance_mode_considers_current_assignments(self):
+    def test_balance_mode_considers_current_assignments(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
             Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         current_assignments = {"Alice": 2, "Bob": 0, "Charlie": 0}
         
         selected, warnings = select_reviewers(
@@ -173,14 +136,14 @@ class TestBalanceMode:
         assert "Charlie" in selected
         assert "Alice" not in selected
 
-    def test_select_reviewers_balance_mode_default(self):
+    def test_select_reviewers_balance_mode_default(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
             Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         current_assignments = {"Alice": 2, "Bob": 0, "Charlie": 0}
         
         selected, warnings = select_reviewers(
@@ -197,14 +160,14 @@ class TestBalanceMode:
         assert "Charlie" in selected
         assert "Alice" not in selected
 
-    def test_select_reviewers_no_balance_mode(self):
+    def test_select_reviewers_no_balance_mode(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
             Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         current_assignments = {"Alice": 2, "Bob": 0, "Charlie": 0}
         
         selected, warnings = select_reviewers(
@@ -220,24 +183,10 @@ class TestBalanceMode:
         assert len(selected) == 2
         assert "Alice" in selected or "Bob" in selected or "Charlie" in selected
 
-    def test_merge_config_no_balance(self):
-        import sys
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_csv = f.name
-        
-        try:
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_csv]
-            
-            args = parse_arguments()
-            
-            config = {"no_balance": True}
-            args = merge_config(config, args)
-            
-            assert args.no_balance is True
+    def test_merge_config_no_balance(self, base_args):
+        args = base_args
+
+        config = {"no_balance": True}
+        args = merge_config(config, args)
             
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_csv)
+        assert args.no_balance is True
@@ -1,172 +1,57 @@
-import tempfile
-
 import pytest
 
 from pr_pairing import KnowledgeMode, merge_config
-from pr_pairing.cli import parse_arguments
+from pr_pairing.cli import create_parser
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return create_parser()
 
 
 class TestParseArgs:
-    def test_default_reviewers(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path]
-            
-            args = parse_arguments()
-            args = merge_config({}, args)
-            
-            assert args.reviewers == 2
-            assert args.team_mode is False
-            assert args.knowledge_mode == KnowledgeMode.ANYONE.value
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_custom_reviewers(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '-r', '4']
-            
-            args = parse_arguments()
-            
-            assert args.reviewers == 4
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_team_mode_flag(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '-t']
-            
-            args = parse_arguments()
-            
-            assert args.team_mode is True
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_knowledge_mode_choices(self):
-        modes = [
-            (KnowledgeMode.ANYONE, "anyone"),
-            (KnowledgeMode.EXPERTS_ONLY, "experts-only"),
-            (KnowledgeMode.MENTORSHIP, "mentorship"),
-            (KnowledgeMode.SIMILAR_LEVELS, "similar-levels"),
-        ]
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            
-            for enum_mode, str_mode in modes:
-                sys.argv = ['pr_pairing.py', '-i', temp_path, '-k', str_mode]
-                args = parse_arguments()
-                assert args.knowledge_mode == enum_mode.value
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
+    @pytest.mark.parametrize("argv_extra,attr,expected", [
+        ([], "reviewers", 2),
+        (["-r", "4"], "reviewers", 4),
+        ([], "team_mode", False),
+        (["-t"], "team_mode", True),
+        ([], "knowledge_mode", KnowledgeMode.ANYONE.value),
+    ])
+    def test_parse_args_flags(self, parser, argv_extra, attr, expected):
+        args = parser.parse_args(['-i', 'team.csv', *argv_extra])
+        args = merge_config({}, args)
+
+        assert getattr(args, attr) == expected
+
+    @pytest.mark.parametrize("enum_mode,str_mode", [
+        (KnowledgeMode.ANYONE, "anyone"),
+        (KnowledgeMode.EXPERTS_ONLY, "experts-only"),
+        (KnowledgeMode.MENTORSHIP, "mentorship"),
+        (KnowledgeMode.SIMILAR_LEVELS, "similar-levels"),
+    ])
+    def test_knowledge_mode_choices(self, parser, enum_mode, str_mode):
+        args = parser.parse_args(['-i', 'team.csv', '-k', str_mode])
+
+        assert args.knowledge_mode == enum_mode.value
 
 
 class TestOutputArgs:
-    def test_output_file_arg(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '-o', 'output.json']
-            
-            args = parse_arguments()
-            
-            assert args.output == 'output.json'
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_output_format_arg_json(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '--output-format', 'json']
-            
-            args = parse_arguments()
-            
-            assert args.output_format == 'json'
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_output_format_arg_yaml(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path, '--output-format', 'yaml']
-            
-            args = parse_arguments()
-            
-            assert args.output_format == 'yaml'
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_output_format_default(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("name,can_review\nAlice,true")
-            temp_path = f.name
-
-        try:
-            import sys
-            old_argv = sys.argv
-            sys.argv = ['pr_pairing.py', '-i', temp_path]
-            
-            args = parse_arguments()
-            
-            assert args.output_format is None
-            
-            sys.argv = old_argv
-        finally:
-            import os
-            os.unlink(temp_path)
+    def test_output_file_arg(self, parser):
+        args = parser.parse_args(['-i', 'team.csv', '-o', 'output.json'])
+
+        assert args.output == 'output.json'
+
+    def test_output_format_arg_json(self, parser):
+        args = parser.parse_args(['-i', 'team.csv', '--output-format', 'json'])
+
+        assert args.output_format == 'json'
+
+    def test_output_format_arg_yaml(self, parser):
+        args = parser.parse_args(['-i', 'team.csv', '--output-format', 'yaml'])
+
+        assert args.output_format == 'yaml'
+
+    def test_output_format_default(self, parser):
+        args = parser.parse_args(['-i', 'team.csv'])
+
+        assert args.output_format is None
@@ -1,4 +1,4 @@
-import tempfile
+import io
 
 import pytest
 
@@ -11,259 +11,150 @@ from pr_pairing import (
     assign_reviewers,
     KnowledgeMode,
     Developer,
-    History,
 )
 
 
+_VALID_DEVS = frozenset(("Alice", "Bob", "Charlie"))
+_VALID_DEVS_4 = frozenset(("Alice", "Bob", "Charlie", "Dana"))
+
+
+def by_name(developers):
+    return {d.name: d for d in developers}
+
+
+def _select_excluding(dev, candidates, history, exclusions, **over):
+    """select_reviewers with the kwargs every exclusion test shares."""
+    kwargs = dict(num_reviewers=2, team_mode=False, current_assignments={})
+    kwargs.update(over)
+    return select_reviewers(
+        dev=dev,
+        candidates=candidates,
+        history=history,
+        exclusions=exclusions,
+        **kwargs,
+    )
+
+
 class TestExclusionFunctions:
-    def test_parse_exclusion_string_valid(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_exclusion_string("Alice:Bob", valid_developers)
-        assert result == ("Alice", "Bob")
-    
-    def test_parse_exclusion_string_invalid_no_colon(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_exclusion_string("AliceBob", valid_developers)
-        assert result is None
-    
-    def test_parse_exclusion_string_nonexistent_developer(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_exclusion_string("Alice:David", valid_developers)
-        assert result is None
-    
-    def test_parse_exclusion_string_empty(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_exclusion_string("", valid_developers)
-        assert result is None
-    
-    def test_parse_exclusion_string_empty_after_strip(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_exclusion_string("Alice:  ", valid_developers)
-        assert result is None
-    
+    @pytest.mark.parametrize("spec,expected", [
+        ("Alice:Bob", ("Alice", "Bob")),
+        ("AliceBob", None),
+        ("Alice:David", None),
+        ("", None),
+        ("Alice:  ", None),
+    ], ids=["valid", "no_colon", "nonexistent_developer", "empty", "empty_after_strip"])
+    def test_parse_exclusion_string(self, spec, expected):
+        result = parse_exclusion_string(spec, _VALID_DEVS)
+        assert result == expected
+
     def test_parse_exclusions_cli_multiple(self):
-        valid_developers = {"Alice", "Bob", "Charlie", "Dana"}
         exclusions = ["Alice:Bob", "Charlie:Dana"]
         
-        result = parse_exclusions_cli(exclusions, valid_developers)
+        result = parse_exclusions_cli(exclusions, _VALID_DEVS_4)
         assert result == {("Alice", "Bob"), ("Charlie", "Dana")}
     
     def test_parse_exclusions_cli_skips_invalid(self):
-        valid_developers = {"Alice", "Bob", "Charlie", "Dana"}
         exclusions = ["Alice:Bob", "Invalid:David", "Charlie:Dana"]
         
-        result = parse_exclusions_cli(exclusions, valid_developers)
+        result = parse_exclusions_cli(exclusions, _VALID_DEVS_4)
         assert result == {("Alice", "Bob"), ("Charlie", "Dana")}
     
     def test_load_exclusions_from_csv(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,excluded_reviewer\n")
-            f.write("Alice,Bob\n")
-            f.write("Bob,Alice\n")
-            f.write("Charlie,Dana\n")
-            temp_path = f.name
-        
-        try:
-            exclusions = load_exclusions_from_csv(temp_path)
-            assert ("Alice", "Bob") in exclusions
-            assert ("Bob", "Alice") in exclusions
-            assert ("Charlie", "Dana") in exclusions
-            assert len(exclusions) == 3
-        finally:
-            import os
-            os.unlink(temp_path)
-    
+        source = io.StringIO(
+            "developer,excluded_reviewer\n"
+            "Alice,Bob\n"
+            "Bob,Alice\n"
+            "Charlie,Dana\n"
+        )
+
+        exclusions = load_exclusions_from_csv(source)
+        assert ("Alice", "Bob") in exclusions
+        assert ("Bob", "Alice") in exclusions
+        assert ("Charlie", "Dana") in exclusions
+        assert len(exclusions) == 3
+
     def test_load_exclusions_from_csv_empty(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,excluded_reviewer\n")
-            temp_path = f.name
-        
-        try:
-            exclusions = load_exclusions_from_csv(temp_path)
-            assert len(exclusions) == 0
-        finally:
-            import os
-            os.unlink(temp_path)
-    
+        exclusions = load_exclusions_from_csv(io.StringIO("developer,excluded_reviewer\n"))
+        assert len(exclusions) == 0
+
+    def test_load_exclusions_from_csv_path(self, tmp_path):
+        temp_path = tmp_path / "exclusions.csv"
+        temp_path.write_text("developer,excluded_reviewer\nAlice,Bob\n")
+
+        exclusions = load_exclusions_from_csv(str(temp_path))
+        assert exclusions == {("Alice", "Bob")}
+
     def test_load_exclusions_from_yaml(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("exclusions:\n")
-            f.write("  - developers: [Alice, Bob]\n")
-            f.write("  - developers: [Charlie, Dana]\n")
-            temp_path = f.name
-        
-        try:
-            exclusions = load_exclusions_from_yaml(temp_path)
-            assert ("Alice", "Bob") in exclusions
-            assert ("Bob", "Alice") in exclusions
-            assert ("Charlie", "Dana") in exclusions
-            assert ("Dana", "Charlie") in exclusions
-            assert len(exclusions) == 4
-        finally:
-            import os
-            os.unlink(temp_path)
-    
+        source = io.StringIO(
+            "exclusions:\n"
+            "  - developers: [Alice, Bob]\n"
+            "  - developers: [Charlie, Dana]\n"
+        )
+
+        exclusions = load_exclusions_from_yaml(source)
+        assert ("Alice", "Bob") in exclusions
+        assert ("Bob", "Alice") in exclusions
+        assert ("Charlie", "Dana") in exclusions
+        assert ("Dana", "Charlie") in exclusions
+        assert len(exclusions) == 4
+
     def test_load_exclusions_from_yaml_empty(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("exclusions: []\n")
-            temp_path = f.name
-        
-        try:
-            exclusions = load_exclusions_from_yaml(temp_path)
-            assert len(exclusions) == 0
-        finally:
-            import os
-            os.unlink(temp_path)
+        exclusions = load_exclusions_from_yaml(io.StringIO("exclusions: []\n"))
+        assert len(exclusions) == 0
 
 
 class TestExclusionInSelectReviewers:
-    def test_exclude_single_reviewer(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
-        ]
-        dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
-        selected, warnings = select_reviewers(
-            dev=dev,
-            candidates=candidates,
-            history=history,
-            num_reviewers=2,
-            team_mode=False,
-            current_assignments={},
-            exclusions={("Dana", "Bob")}
-        )
-        
-        assert "Bob" not in selected
-        assert "Alice" in selected
-        assert "Charlie" in selected
-    
-    def test_exclude_multiple_reviewers(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
-        ]
+    @pytest.mark.parametrize("num_candidates,exclusions,expected_selected,expected_warning_substr", [
+        (3, {("Dana", "Bob")}, {"Alice", "Charlie"}, None),
+        (3, {("Dana", "Alice"), ("Dana", "Bob")}, {"Charlie"}, None),
+        (2, {("Dana", "Alice"), ("Dana", "Bob")}, set(), "All reviewers excluded"),
+    ], ids=["single", "multi", "all"])
+    def test_exclude_reviewers(self, three_mixed_candidates, empty_history,
+                               num_candidates, exclusions, expected_selected,
+                               expected_warning_substr):
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
-        selected, warnings = select_reviewers(
-            dev=dev,
-            candidates=candidates,
-            history=history,
-            num_reviewers=2,
-            team_mode=False,
-            current_assignments={},
-            exclusions={("Dana", "Alice"), ("Dana", "Bob")}
-        )
-        
-        assert "Alice" not in selected
-        assert "Bob" not in selected
-        assert "Charlie" in selected
-    
-    def test_exclude_all_reviewers(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
-        ]
-        dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
-        selected, warnings = select_reviewers(
-            dev=dev,
-            candidates=candidates,
-            history=history,
-            num_reviewers=2,
-            team_mode=False,
-            current_assignments={},
-            exclusions={("Dana", "Alice"), ("Dana", "Bob")}
+
+        selected, warnings = _select_excluding(
+            dev, three_mixed_candidates[:num_candidates], empty_history, exclusions
         )
-        
-        assert len(selected) == 0
-        assert "All reviewers excluded" in warnings[0]
-    
-    def test_exclusion_with_knowledge_filter(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=2),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=4),
-        ]
+
+        assert set(selected) == expected_selected
+        if expected_warning_substr is not None:
+            assert expected_warning_substr in warnings[0]
+
+    def test_exclusion_with_knowledge_filter(self, three_knowledge_candidates, empty_history):
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
-        selected, warnings = select_reviewers(
-            dev=dev,
-            candidates=candidates,
-            history=history,
-            num_reviewers=2,
-            team_mode=False,
-            current_assignments={},
+
+        selected, warnings = _select_excluding(
+            dev, three_knowledge_candidates, empty_history, {("Dana", "Charlie")},
             knowledge_mode=KnowledgeMode.EXPERTS_ONLY,
-            exclusions={("Dana", "Charlie")}
         )
-        
+
         assert "Charlie" not in selected
         assert "Alice" in selected
         assert "Bob" not in selected
-    
-    def test_exclusion_with_team_mode(self):
+
+    def test_exclusion_with_team_mode(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
             Developer(name="Charlie", can_review=True, team="frontend", knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True, team="frontend")
-        history = History(pairs={}, last_run=None)
-        
-        selected, warnings = select_reviewers(
-            dev=dev,
-            candidates=candidates,
-            history=history,
-            num_reviewers=2,
+
+        selected, warnings = _select_excluding(
+            dev, candidates, empty_history, {("Dana", "Alice")},
             team_mode=True,
-            current_assignments={},
-            exclusions={("Dana", "Alice")}
         )
-        
+
         assert "Alice" not in selected
         assert "Charlie" in selected
 
 
 class TestExclusionInAssignReviewers:
-    def test_assign_reviewers_with_exclusions(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
-        
-        warnings = assign_reviewers(
-            developers=developers,
-            history=history,
-            num_reviewers=1,
-            team_mode=False,
-            knowledge_mode=KnowledgeMode.ANYONE,
-            exclusions={("Alice", "Bob")}
-        )
-        
-        alice = next(d for d in developers if d.name == "Alice")
-        assert "Bob" not in alice.reviewers
-    
-    def test_assign_reviewers_exclusion_warning(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
+    def test_assign_reviewers_with_exclusions(self, abc_devs, empty_history):
+        developers = abc_devs
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -274,5 +165,5 @@ class TestExclusionInAssignReviewers:
             exclusions={("Alice", "Bob")}
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
+        alice = by_name(developers)["Alice"]
         assert "Bob" not in alice.reviewers
@@ -1,10 +1,9 @@
 import json
-import tempfile
-
-import pytest
+from pathlib import Path
 
 from pr_pairing import (
     load_history,
+    serialize_history,
     save_history,
     get_pair_count,
     get_total_reviews_assigned,
@@ -14,43 +13,41 @@ from pr_pairing import (
 
 
 class TestHistoryFunctions:
-    def test_load_nonexistent_history(self):
-        import os
-        temp_path = "/tmp/nonexistent_history_12345.json"
-        
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-        
-        history = load_history(temp_path)
-        
+    def test_load_nonexistent_history(self, tmp_path):
+        history = load_history(str(tmp_path / "nonexistent_history.json"))
+
         assert history.pairs == {}
         assert history.last_run is None
 
     def test_load_existing_history(self, sample_history):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(sample_history.to_dict(), f)
-            temp_path = f.name
-
-        try:
-            history = load_history(temp_path)
-            
-            assert hasattr(history, 'pairs')
-            assert "Alice" in history.pairs
-            assert history.pairs["Alice"]["Bob"] == 2
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_save_history_with_timestamp(self, temp_history):
+        history = History.from_dict(sample_history.to_dict())
+
+        assert hasattr(history, 'pairs')
+        assert "Alice" in history.pairs
+        assert history.pairs["Alice"]["Bob"] == 2
+
+    def test_load_history_from_file(self, sample_history, tmp_path):
+        temp_path = tmp_path / "history.json"
+        temp_path.write_text(json.dumps(sample_history.to_dict()))
+
+        history = load_history(str(temp_path))
+
+        assert history.pairs == sample_history.pairs
+
+    def test_serialize_history_sets_timestamp(self, empty_history):
+        saved = serialize_history(empty_history)
+
+        assert saved["last_run"] is not None
+        assert "Z" in saved["last_run"] or "+00:00" in saved["last_run"]
+
+    def test_save_history_writes_file(self, temp_history):
         history = load_history(temp_history)
-        
+
         save_history(temp_history, history)
-        
-        with open(temp_history, 'r') as f:
-            saved = json.load(f)
-        
+
+        saved = json.loads(Path(temp_history).read_text())
+
         assert saved["last_run"] is not None
-        assert "Z" in saved["last_run"] or "+00:00" in saved["last_run"]
 
 
 class TestHistoryTracking:
@@ -1,5 +1,5 @@
 import json
-import tempfile
+
 import pytest
 
 from pr_pairing import Developer
@@ -11,23 +11,42 @@ from pr_pairing.output import (
 )
 
 
+@pytest.fixture(scope="module")
+def json_outputs():
+    """Serialize and re-parse each case once per module, not per test."""
+    cases = {
+        "basic": (
+            [
+                Developer(name="Alice", can_review=True, reviewers=["Bob", "Charlie"]),
+                Developer(name="Bob", can_review=True, reviewers=["Alice", "Dana"]),
+            ],
+            {"input": "team.csv", "reviewers": 2, "team_mode": False,
+             "knowledge_mode": "anyone"},
+        ),
+        "team_mode": (
+            [
+                Developer(name="Alice", can_review=True, team="frontend", reviewers=["Bob"]),
+                Developer(name="Bob", can_review=True, team="backend", reviewers=["Alice"]),
+            ],
+            {"input": "team.csv", "reviewers": 1, "team_mode": True,
+             "knowledge_mode": "mentorship"},
+        ),
+        "empty_reviewers": (
+            [Developer(name="Alice", can_review=True, reviewers=[])],
+            {"input": "team.csv", "reviewers": 2, "team_mode": False,
+             "knowledge_mode": "anyone"},
+        ),
+    }
+    return {
+        name: json.loads(format_output_json(developers, params))
+        for name, (developers, params) in cases.items()
+    }
+
+
 class TestFormatOutputJson:
-    def test_format_output_json_basic(self):
-        developers = [
-            Developer(name="Alice", can_review=True, reviewers=["Bob", "Charlie"]),
-            Developer(name="Bob", can_review=True, reviewers=["Alice", "Dana"]),
-        ]
-        params = {
-            "input": "team.csv",
-            "reviewers": 2,
-            "team_mode": False,
-            "knowledge_mode": "anyone"
-        }
-        
-        output = format_output_json(developers, params)
-        
-        data = json.loads(output)
-        
+    def test_format_output_json_basic(self, json_outputs):
+        data = json_outputs["basic"]
+
         assert "generated_at" in data
         assert data["parameters"]["input"] == "team.csv"
         assert data["parameters"]["reviewers"] == 2
@@ -39,40 +58,15 @@ class TestFormatOutputJson:
         assert data["assignments"][1]["developer"] == "Bob"
         assert data["assignments"][1]["reviewers"] == ["Alice", "Dana"]
 
-    def test_format_output_json_with_team_mode(self):
-        developers = [
-            Developer(name="Alice", can_review=True, team="frontend", reviewers=["Bob"]),
-            Developer(name="Bob", can_review=True, team="backend", reviewers=["Alice"]),
-        ]
-        params = {
-            "input": "team.csv",
-            "reviewers": 1,
-            "team_mode": True,
-            "knowledge_mode": "mentorship"
-        }
-        
-        output = format_output_json(developers, params)
-        
-        data = json.loads(output)
-        
+    def test_format_output_json_with_team_mode(self, json_outputs):
+        data = json_outputs["team_mode"]
+
         assert data["parameters"]["team_mode"] is True
         assert data["parameters"]["knowledge_mode"] == "mentorship"
 
-    def test_format_output_json_with_empty_reviewers(self):
-        developers = [
-            Developer(name="Alice", can_review=True, reviewers=[]),
-        ]
-        params = {
-            "input": "team.csv",
-            "reviewers": 2,
-            "team_mode": False,
-            "knowledge_mode": "anyone"
-        }
-        
-        output = format_output_json(developers, params)
-        
-        data = json.loads(output)
-        
+    def test_format_output_json_with_empty_reviewers(self, json_outputs):
+        data = json_outputs["empty_reviewers"]
+
         assert data["assignments"][0]["reviewers"] == []
 
 
@@ -156,30 +150,23 @@ class TestGetOutputFormat:
         assert get_output_format("output.csv", None) == "csv"
         assert get_output_format("output.txt", None) == "csv"
 
+    def test_cache_reuse(self):
+        first = get_output_format("cache-probe.json", None)
+        hits_before = get_output_format.cache_info().hits
 
-class TestWriteOutput:
-    def test_write_output_json(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-        
-        content = '{"test": "data"}'
-        write_output(content, temp_path)
-        
-        with open(temp_path, 'r') as f:
-            assert f.read() == '{"test": "data"}'
-        
-        import os
-        os.unlink(temp_path)
+        second = get_output_format("cache-probe.json", None)
 
-    def test_write_output_yaml(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            temp_path = f.name
-        
-        content = "key: value\n"
-        write_output(content, temp_path)
-        
-        with open(temp_path, 'r') as f:
-            assert f.read() == "key: value\n"
-        
-        import os
-        os.unlink(temp_path)
+        assert second == first == "json"
+        assert get_output_format.cache_info().hits == hits_before + 1
+
+
+class TestWriteOutput:
+    @pytest.mark.parametrize("suffix,content", [
+        (".json", '{"test": "data"}'),
+        (".yaml", "key: value\n"),
+    ], ids=["json", "yaml"])
+    def test_write_output(self, tmp_path, suffix, content):
+        temp_path = tmp_path / f"out{suffix}"
+        write_output(content, str(temp_path))
+
+        assert temp_path.read_text() == content
@@ -1,5 +1,3 @@
-import tempfile
-
 import pytest
 
 from pr_pairing.requirements import (
@@ -11,158 +9,90 @@ from pr_pairing.requirements import (
     check_conflicts,
 )
 from pr_pairing import (
-    select_reviewers,
     assign_reviewers,
     KnowledgeMode,
     Developer,
-    History,
 )
 
 
+_VALID_DEVS = frozenset(("Alice", "Bob", "Charlie"))
+_VALID_DEVS_4 = frozenset(("Alice", "Bob", "Charlie", "Dana"))
+
+
+def by_name(developers):
+    return {d.name: d for d in developers}
+
+
 class TestRequirementsFunctions:
-    def test_parse_requirement_string_valid(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("Bob:Alice", valid_developers)
-        assert result == ("Bob", "Alice")
-    
-    def test_parse_requirement_string_invalid_no_colon(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("BobAlice", valid_developers)
-        assert result is None
-    
-    def test_parse_requirement_string_nonexistent_developer(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("Bob:David", valid_developers)
-        assert result is None
-    
-    def test_parse_requirement_string_nonexistent_reviewer(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("David:Alice", valid_developers)
-        assert result is None
-    
-    def test_parse_requirement_string_empty(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("", valid_developers)
-        assert result is None
-    
-    def test_parse_requirement_string_empty_after_strip(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("Bob:  ", valid_developers)
-        assert result is None
-    
-    def test_parse_requirement_string_self_requirement(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        result = parse_requirement_string("Alice:Alice", valid_developers)
-        assert result is None
-    
+    @pytest.mark.parametrize("spec,expected", [
+        ("Bob:Alice", ("Bob", "Alice")),
+        ("BobAlice", None),
+        ("Bob:David", None),
+        ("David:Alice", None),
+        ("", None),
+        ("Bob:  ", None),
+        ("Alice:Alice", None),
+    ], ids=[
+        "valid", "no_colon", "nonexistent_reviewer", "nonexistent_developer",
+        "empty", "empty_after_strip", "self_requirement",
+    ])
+    def test_parse_requirement_string(self, spec, expected):
+        result = parse_requirement_string(spec, _VALID_DEVS)
+        assert result == expected
+
     def test_parse_requirements_cli_multiple(self):
-        valid_developers = {"Alice", "Bob", "Charlie", "Dana"}
         requirements = ["Bob:Alice", "Bob:Charlie"]
         
-        result = parse_requirements_cli(requirements, valid_developers)
+        result = parse_requirements_cli(requirements, _VALID_DEVS_4)
         assert result == {"Bob": ["Alice", "Charlie"]}
     
     def test_parse_requirements_cli_skips_invalid(self):
-        valid_developers = {"Alice", "Bob", "Charlie", "Dana"}
         requirements = ["Bob:Alice", "Invalid:David", "Bob:Charlie"]
         
-        result = parse_requirements_cli(requirements, valid_developers)
+        result = parse_requirements_cli(requirements, _VALID_DEVS_4)
         assert result == {"Bob": ["Alice", "Charlie"]}
     
-    def test_load_requirements_from_csv(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,required_reviewer\n")
-            f.write("Bob,Alice\n")
-            f.write("Bob,Charlie\n")
-            f.write("Dana,Alice\n")
-            temp_path = f.name
-        
-        try:
-            requirements = load_requirements_from_csv(temp_path)
-            assert requirements == {"Bob": ["Alice", "Charlie"], "Dana": ["Alice"]}
-        finally:
-            import os
-            os.unlink(temp_path)
+    def test_load_requirements_from_csv(self, requirements_csv):
+        requirements = load_requirements_from_csv(requirements_csv)
+        assert requirements == {"Bob": ["Alice", "Charlie"], "Dana": ["Alice"]}
     
-    def test_load_requirements_from_csv_empty(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,required_reviewer\n")
-            temp_path = f.name
+    def test_load_requirements_from_csv_empty(self, tmp_path):
+        temp_path = tmp_path / "requirements.csv"
+        temp_path.write_text("developer,required_reviewer\n")
         
-        try:
-            requirements = load_requirements_from_csv(temp_path)
-            assert requirements == {}
-        finally:
-            import os
-            os.unlink(temp_path)
+        requirements = load_requirements_from_csv(temp_path)
+        assert requirements == {}
     
-    def test_load_requirements_from_yaml(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("requirements:\n")
-            f.write("  - developer: Bob\n")
-            f.write("    required_reviewers:\n")
-            f.write("      - Alice\n")
-            f.write("      - Charlie\n")
-            f.write("  - developer: Dana\n")
-            f.write("    required_reviewers:\n")
-            f.write("      - Alice\n")
-            temp_path = f.name
-        
-        try:
-            requirements = load_requirements_from_yaml(temp_path)
-            assert requirements == {"Bob": ["Alice", "Charlie"], "Dana": ["Alice"]}
-        finally:
-            import os
-            os.unlink(temp_path)
+    def test_load_requirements_from_yaml(self, requirements_yaml):
+        requirements = load_requirements_from_yaml(requirements_yaml)
+        assert requirements == {"Bob": ["Alice", "Charlie"], "Dana": ["Alice"]}
     
-    def test_load_requirements_from_yaml_empty(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("requirements: []\n")
-            temp_path = f.name
+    def test_load_requirements_from_yaml_empty(self, tmp_path):
+        temp_path = tmp_path / "requirements.yaml"
+        temp_path.write_text("requirements: []\n")
         
-        try:
-            requirements = load_requirements_from_yaml(temp_path)
-            assert requirements == {}
-        finally:
-            import os
-            os.unlink(temp_path)
+        requirements = load_requirements_from_yaml(temp_path)
+        assert requirements == {}
     
-    def test_load_requirements_validates_developers(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,required_reviewer\n")
-            f.write("Invalid,Alice\n")
-            temp_path = f.name
+    def test_load_requirements_validates_developers(self, tmp_path):
+        temp_path = tmp_path / "requirements.csv"
+        temp_path.write_text(
+            "developer,required_reviewer\n"
+            "Invalid,Alice\n"
+        )
         
-        try:
-            with pytest.raises(Exception):
-                load_requirements(temp_path, valid_developers)
-        finally:
-            import os
-            os.unlink(temp_path)
+        with pytest.raises(Exception):
+            load_requirements(temp_path, _VALID_DEVS)
     
-    def test_load_requirements_validates_reviewers(self):
-        valid_developers = {"Alice", "Bob", "Charlie"}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("developer,required_reviewer\n")
-            f.write("Bob,Invalid\n")
-            temp_path = f.name
+    def test_load_requirements_validates_reviewers(self, tmp_path):
+        temp_path = tmp_path / "requirements.csv"
+        temp_path.write_text(
+            "developer,required_reviewer\n"
+            "Bob,Invalid\n"
+        )
         
-        try:
-            with pytest.raises(Exception):
-                load_requirements(temp_path, valid_developers)
-        finally:
-            import os
-            os.unlink(temp_path)
+        with pytest.raises(Exception):
+            load_requirements(temp_path, _VALID_DEVS)
 
 
 class TestCheckConflicts:
@@ -190,13 +120,9 @@ class TestCheckConflicts:
 
 
 class TestRequirementsInAssignReviewers:
-    def test_assign_reviewers_with_requirements(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
+    def test_assign_reviewers_with_requirements(self, abc_devs, empty_history):
+        developers = abc_devs
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -207,16 +133,16 @@ class TestRequirementsInAssignReviewers:
             requirements={"Alice": ["Bob"]}
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
+        alice = by_name(developers)["Alice"]
         assert "Bob" in alice.reviewers
     
-    def test_assign_reviewers_with_requirements_team_mode(self):
+    def test_assign_reviewers_with_requirements_team_mode(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True, team="frontend"),
             Developer(name="Bob", can_review=True, team="frontend"),
             Developer(name="Charlie", can_review=True, team="backend"),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -227,16 +153,16 @@ class TestRequirementsInAssignReviewers:
             requirements={"Alice": ["Bob"]}
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
+        alice = by_name(developers)["Alice"]
         assert "Bob" in alice.reviewers
     
-    def test_assign_reviewers_requirement_for_non_reviewer(self):
+    def test_assign_reviewers_requirement_for_non_reviewer(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True),
             Developer(name="Bob", can_review=False),
             Developer(name="Charlie", can_review=True),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -249,13 +175,9 @@ class TestRequirementsInAssignReviewers:
         
         assert any("Cannot fulfill requirement" in w for w in warnings)
     
-    def test_assign_reviewers_self_requirement(self):
-        developers = [
-            Developer(name="Alice", can_review=True),
-            Developer(name="Bob", can_review=True),
-            Developer(name="Charlie", can_review=True),
-        ]
-        history = History(pairs={}, last_run=None)
+    def test_assign_reviewers_self_requirement(self, abc_devs, empty_history):
+        developers = abc_devs
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -268,14 +190,14 @@ class TestRequirementsInAssignReviewers:
         
         assert any("Skipping self-requirement" in w for w in warnings)
     
-    def test_assign_reviewers_multiple_requirements(self):
+    def test_assign_reviewers_multiple_requirements(self, empty_history):
         developers = [
             Developer(name="Alice", can_review=True),
             Developer(name="Bob", can_review=True),
             Developer(name="Charlie", can_review=True),
             Developer(name="Dana", can_review=True),
         ]
-        history = History(pairs={}, last_run=None)
+        history = empty_history
         
         warnings = assign_reviewers(
             developers=developers,
@@ -289,7 +211,8 @@ class TestRequirementsInAssignReviewers:
             }
         )
         
-        alice = next(d for d in developers if d.name == "Alice")
-        charlie = next(d for d in developers if d.name == "Charlie")
+        devs = by_name(developers)
+        alice = devs["Alice"]
+        charlie = devs["Charlie"]
         assert "Bob" in alice.reviewers
         assert "Dana" in charlie.reviewers
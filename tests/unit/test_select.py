@@ -1,149 +1,120 @@
-import pytest
-
 from pr_pairing import select_reviewers, KnowledgeMode, Developer, History
 
 
 class TestSelectReviewers:
-    def test_no_self_review(self):
+    def test_no_self_review(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Alice", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={}
         )
-        
+
         assert "Alice" not in selected
         assert len(selected) == 1
         assert "Bob" in selected
 
-    def test_select_correct_number(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
-        ]
+    def test_select_correct_number(self, three_mixed_candidates, empty_history):
         dev = Developer(name="Alice", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
-            candidates=candidates,
-            history=history,
+            candidates=three_mixed_candidates,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={}
         )
-        
+
         assert len(selected) == 2
 
-    def test_select_fewer_when_not_enough(self):
+    def test_select_fewer_when_not_enough(self, empty_history):
         candidates = [
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Alice", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=3,
             team_mode=False,
             current_assignments={}
         )
-        
+
         assert len(selected) == 1
 
-    def test_experts_only_filter(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=2),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=4),
-        ]
+    def test_experts_only_filter(self, three_knowledge_candidates, empty_history):
         dev = Developer(name="Dana", can_review=True)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
-            candidates=candidates,
-            history=history,
+            candidates=three_knowledge_candidates,
+            history=empty_history,
             num_reviewers=3,
             team_mode=False,
             current_assignments={},
             knowledge_mode=KnowledgeMode.EXPERTS_ONLY
         )
-        
+
         assert "Bob" not in selected
         assert "Alice" in selected
         assert "Charlie" in selected
         assert len(selected) == 2
 
-    def test_mentorship_novice_gets_expert(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=2),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=4),
-        ]
+    def test_mentorship_novice_gets_expert(self, three_knowledge_candidates, empty_history):
         dev = Developer(name="Dana", can_review=True, knowledge_level=1)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
-            candidates=candidates,
-            history=history,
+            candidates=three_knowledge_candidates,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
             knowledge_mode=KnowledgeMode.MENTORSHIP
         )
-        
+
         assert "Bob" not in selected
         assert "Alice" in selected
         assert "Charlie" in selected
 
-    def test_mentorship_senior_can_get_anyone(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
-            Developer(name="Bob", can_review=True, team="backend", knowledge_level=2),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=4),
-        ]
+    def test_mentorship_senior_can_get_anyone(self, three_knowledge_candidates, empty_history):
         dev = Developer(name="Dana", can_review=True, knowledge_level=4)
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
-            candidates=candidates,
-            history=history,
+            candidates=three_knowledge_candidates,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
             knowledge_mode=KnowledgeMode.MENTORSHIP
         )
-        
+
         assert "Bob" in selected or "Alice" in selected or "Charlie" in selected
 
-    def test_similar_levels_filters_by_one_level(self):
+    def test_similar_levels_filters_by_one_level(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=1),
             Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True, knowledge_level=2)
-        history = History(pairs={}, last_run=None)
 
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
@@ -154,18 +125,17 @@ class TestSelectReviewers:
         assert "Bob" in selected
         assert "Alice" not in selected
 
-    def test_similar_levels_warns_when_no_similar_reviewers(self):
+    def test_similar_levels_warns_when_no_similar_reviewers(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, team="frontend", knowledge_level=5),
             Developer(name="Bob", can_review=True, team="backend", knowledge_level=5),
         ]
         dev = Developer(name="Dana", can_review=True, knowledge_level=1)
-        history = History(pairs={}, last_run=None)
 
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
@@ -175,18 +145,17 @@ class TestSelectReviewers:
         assert len(selected) == 0
         assert any("within 1 knowledge level" in w for w in warnings)
 
-    def test_similar_levels_allows_exact_level_match(self):
+    def test_similar_levels_allows_exact_level_match(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, knowledge_level=3),
             Developer(name="Bob", can_review=True, knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True, knowledge_level=3)
-        history = History(pairs={}, last_run=None)
 
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
@@ -196,18 +165,17 @@ class TestSelectReviewers:
         assert "Alice" in selected
         assert "Bob" in selected
 
-    def test_similar_levels_edge_case_level_1(self):
+    def test_similar_levels_edge_case_level_1(self, empty_history):
         candidates = [
             Developer(name="Alice", can_review=True, knowledge_level=2),
             Developer(name="Bob", can_review=True, knowledge_level=3),
         ]
         dev = Developer(name="Dana", can_review=True, knowledge_level=1)
-        history = History(pairs={}, last_run=None)
 
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
-            history=history,
+            history=empty_history,
             num_reviewers=2,
             team_mode=False,
             current_assignments={},
@@ -217,24 +185,18 @@ class TestSelectReviewers:
         assert "Alice" in selected
         assert "Bob" not in selected
 
-    def test_team_mode_prioritizes_same_team(self):
-        candidates = [
-            Developer(name="Alice", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Bob", can_review=True, team="frontend", knowledge_level=3),
-            Developer(name="Charlie", can_review=True, team="backend", knowledge_level=3),
-        ]
+    def test_team_mode_prioritizes_same_team(self, three_team_candidates, empty_history):
         dev = Developer(name="Alice", can_review=True, team="frontend")
-        history = History(pairs={}, last_run=None)
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
-            candidates=candidates,
-            history=history,
+            candidates=three_team_candidates,
+            history=empty_history,
             num_reviewers=2,
             team_mode=True,
             current_assignments={}
         )
-        
+
         assert "Bob" in selected
         assert "Charlie" in selected or "Alice" not in selected
 
@@ -248,7 +210,7 @@ class TestSelectReviewers:
             pairs={"Dana": {"Alice": 5, "Bob": 0}},
             last_run=None
         )
-        
+
         selected, warnings = select_reviewers(
             dev=dev,
             candidates=candidates,
@@ -257,5 +219,5 @@ class TestSelectReviewers:
             team_mode=False,
             current_assignments={}
         )
-        
+
         assert "Bob" in selected[0] or selected[0] == "Bob"
@@ -1,4 +1,3 @@
-import pytest
 from pr_pairing.validation import (
     ValidationResult,
     validate_csv,